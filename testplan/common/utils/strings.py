@@ -1,5 +1,6 @@
 """String manipulation utilities."""
 
+import functools
 import os
 import re
 import inspect
@@ -101,10 +102,12 @@ def format_description(description):
     return ""
 
 
+@functools.lru_cache(maxsize=256)
 def slugify(value):
     """
     Normalizes string, converts to lowercase, removes non-alpha characters,
-    and converts spaces to hyphens.
+    and converts spaces to hyphens. Results are cached as the same entity
+    names get slugified repeatedly (e.g. for runpaths).
 
     :param value: string value to slugify
     :type value: ``str``
@@ -2,9 +2,11 @@
 Classes that parse command-line arguments used to control testplan behaviour.
 This module encodes the argument and option names, types, and behaviours.
 """
+
 import argparse
-import copy
+import os
 import sys
+from types import MappingProxyType
 from typing import Dict
 
 from testplan import defaults
@@ -12,18 +14,68 @@ from testplan.common.utils import logger
 from testplan.report.testing import styles, ReportTagsAction
 from testplan.testing import listing, filtering, ordering
 
+# Option strings of the argument groups, a group is only built when one of
+# its options is given on the command line (all of them for help output).
+_GENERAL_FLAGS = frozenset({"--runpath", "--timeout", "-i", "--interactive"})
+_FILTER_FLAGS = frozenset({"--patterns", "--tags", "--tags-all"})
+_ORDERING_FLAGS = frozenset({"--shuffle", "--shuffle-seed"})
+_REPORT_FLAGS = frozenset(
+    {
+        "--stdout-style",
+        "--pdf",
+        "--json",
+        "--xml",
+        "--http",
+        "--report-dir",
+        "--pdf-style",
+        "-v",
+        "--verbose",
+        "-d",
+        "--debug",
+        "-b",
+        "--browse",
+        "-u",
+        "--ui",
+        "--report-tags",
+        "--report-tags-all",
+        "--file-log-level",
+        "--label",
+    }
+)
+_KNOWN_FLAGS = frozenset({"--info", "--list"}).union(
+    _GENERAL_FLAGS, _FILTER_FLAGS, _ORDERING_FLAGS, _REPORT_FLAGS
+)
+
+# Destinations of the test filter options, combined by `process_args`
+_FILTER_ARG_NAMES = ("tags", "tags_all", "patterns")
+
+
+class _PartialParserError(Exception):
+    """Parse error of a parser built without every argument group."""
+
 
 class HelpParser(argparse.ArgumentParser):
     """
     Extends ``ArgumentParser`` in order to print the help message upon failure.
     """
 
+    # Set on parsers missing some argument groups, their help & usage would
+    # be incomplete so errors are raised for the caller to parse again with
+    # every group instead.
+    partial = False
+
     def error(self, message: str) -> None:
         """
         Overrides `error` method to print error and display help message.
+        The full help is only rendered for an interactive terminal and can be
+        disabled by setting the ``TESTPLAN_NO_HELP_ON_ERROR`` environment
+        variable, otherwise just the usage is printed.
 
         :param message: the parsing error message
         """
+        if self.partial:
+            raise _PartialParserError(message)
+
         error_header = "=" * 30 + " ERROR " + "=" * 30
         error_ctx = [
             "\n",
@@ -36,21 +88,84 @@ class HelpParser(argparse.ArgumentParser):
             "\n",
         ]
 
-        self.print_help()
+        if sys.stdout.isatty() and not os.environ.get(
+            "TESTPLAN_NO_HELP_ON_ERROR"
+        ):
+            self.print_help()
+        else:
+            self.print_usage(sys.stderr)
         sys.stderr.writelines(error_ctx)
         sys.exit(2)
 
 
+# Stdout style of verbose & debug modes
+_DETAIL_STYLE = styles.Style(
+    styles.StyleEnum.ASSERTION_DETAIL, styles.StyleEnum.ASSERTION_DETAIL
+)
+
+
+_NO_DEFAULT = object()
+
+
+class _ArgumentDefaults(dict):
+    """
+    Stand-in for an argument group that is not built, only records the
+    value argparse would give each argument when it is absent from the
+    command line, keyed by its destination.
+    """
+
+    # Defaults implied by the action when none is given explicitly
+    ACTION_DEFAULTS = {"store_true": False, "store_false": True}
+
+    def add_argument(
+        self, *option_strings, dest=None, default=_NO_DEFAULT, **kwargs
+    ):
+        """Records the default value of the argument."""
+        if default is argparse.SUPPRESS:
+            return
+
+        if dest is None:
+            long_options = [
+                option for option in option_strings if option.startswith("--")
+            ]
+            dest = (long_options or option_strings)[0].lstrip("-")
+            dest = dest.replace("-", "_")
+
+        if default is _NO_DEFAULT:
+            default = self.ACTION_DEFAULTS.get(kwargs.get("action"))
+        elif isinstance(default, str) and callable(kwargs.get("type")):
+            # argparse converts string defaults with the argument type
+            default = kwargs["type"](default)
+        self[dest] = default
+
+
 class TestplanParser:
     """
     Wrapper around `argparse.ArgumentParser`, adds extra step for processing
     arguments, useful when there are cross-dependencies between them.
     """
 
+    __slots__ = (
+        "name",
+        "_default_options",
+        "_parser",
+        "_parser_groups",
+        "_requested_groups",
+    )
+
     def __init__(self, name: str, default_options: Dict) -> None:
-        self.cmd_line = copy.copy(sys.argv)
         self.name = name
-        self._default_options = default_options
+        # Read-only snapshot, the generated parser is cached and must not
+        # observe later changes to the defaults.
+        self._default_options = MappingProxyType(dict(default_options))
+        self._parser = None
+        self._parser_groups = frozenset()
+        self._requested_groups = None
+
+    @property
+    def cmd_line(self):
+        """Command line arguments, read from ``sys.argv`` when accessed."""
+        return list(sys.argv)
 
     def add_arguments(self, parser):
         """
@@ -60,8 +175,14 @@ class TestplanParser:
         """
         pass
 
-    def generate_parser(self) -> HelpParser:
-        """Generates an `argparse.ArgumentParser` instance."""
+    def generate_parser(self, groups=None) -> HelpParser:
+        """
+        Generates an `argparse.ArgumentParser` instance.
+
+        :param groups: titles of the argument groups to build, defaults to
+            the groups requested by `parse_args` or else the groups whose
+            options appear on the command line
+        """
         epilog = ""
         parser = HelpParser(
             "Test Plan ({})".format(self.name),
@@ -85,9 +206,58 @@ class TestplanParser:
             help="Shortcut for `--info name`.",
         )
 
-        general_group = parser.add_argument_group("General")
+        if groups is None:
+            groups = self._requested_groups
+        if groups is None:
+            groups = self._required_groups(sys.argv[1:])
+
+        for title, _, build in self._argument_groups():
+            if title in groups:
+                build(parser.add_argument_group(title))
+            else:
+                # Unused group, only register the defaults of its arguments
+                # so the namespace still holds every destination.
+                arg_defaults = _ArgumentDefaults()
+                build(arg_defaults)
+                parser.set_defaults(**arg_defaults)
+
+        self.add_arguments(parser)
+        return parser
+
+    def _argument_groups(self):
+        """Title, option strings & builder method of each argument group."""
+        return (
+            ("General", _GENERAL_FLAGS, self._build_general),
+            ("Filtering", _FILTER_FLAGS, self._build_filter),
+            ("Ordering", _ORDERING_FLAGS, self._build_ordering),
+            ("Reporting", _REPORT_FLAGS, self._build_report),
+        )
+
+    def _required_groups(self, argv) -> frozenset:
+        """
+        Titles of the argument groups needed to parse the given arguments.
+        Every group is needed when an option cannot be attributed to one of
+        them (help, abbreviations, custom arguments etc.).
 
-        general_group.add_argument(
+        :param argv: command line arguments, without the program name
+        """
+        options = frozenset(
+            arg.partition("=")[0] for arg in argv if arg.startswith("-")
+        )
+        groups = self._argument_groups()
+
+        if not options <= _KNOWN_FLAGS:
+            return frozenset(title for title, _, _ in groups)
+
+        return frozenset(
+            title
+            for title, flags, _ in groups
+            if not flags.isdisjoint(options)
+        )
+
+    def _build_general(self, group) -> None:
+        """Adds the General argument group options."""
+        group.add_argument(
             "--runpath",
             type=str,
             metavar="PATH",
@@ -95,7 +265,7 @@ class TestplanParser:
             help="Path under which all temp files and logs will be created.",
         )
 
-        general_group.add_argument(
+        group.add_argument(
             "--timeout",
             metavar="TIMEOUT",
             default=self._default_options["timeout"],
@@ -104,7 +274,7 @@ class TestplanParser:
             "processes. Defaults to 14400s (4h). Set to 0 to disable.",
         )
 
-        general_group.add_argument(
+        group.add_argument(
             "-i",
             "--interactive",
             dest="interactive_port",
@@ -116,9 +286,9 @@ class TestplanParser:
             " the port defaults to {}.".format(defaults.WEB_SERVER_PORT),
         )
 
-        filter_group = parser.add_argument_group("Filtering")
-
-        filter_group.add_argument(
+    def _build_filter(self, group) -> None:
+        """Adds the Filtering argument group options."""
+        group.add_argument(
             "--patterns",
             action=filtering.PatternAction,
             default=[],
@@ -137,7 +307,7 @@ Test filter, supports glob notation & multiple arguments.
 --pattern *:<Suite Name>:<Testcase name>""",
         )
 
-        filter_group.add_argument(
+        group.add_argument(
             "--tags",
             action=filtering.TagsAction,
             default=[],
@@ -150,7 +320,7 @@ Test filter, runs tests that match ANY of the given tags.
 --tags <tag_name_1> <tag_category_1>=<tag_name_2>""",
         )
 
-        filter_group.add_argument(
+        group.add_argument(
             "--tags-all",
             action=filtering.TagsAllAction,
             default=[],
@@ -163,9 +333,9 @@ Test filter, runs tests that match ALL of the given tags.
 --tags-all <tag_name_1> <tag_category_1>=<tag_name_2>""",
         )
 
-        ordering_group = parser.add_argument_group("Ordering")
-
-        ordering_group.add_argument(
+    def _build_ordering(self, group) -> None:
+        """Adds the Ordering argument group options."""
+        group.add_argument(
             "--shuffle",
             nargs="+",
             type=str,
@@ -174,7 +344,7 @@ Test filter, runs tests that match ALL of the given tags.
             help="Shuffle execution order",
         )
 
-        ordering_group.add_argument(
+        group.add_argument(
             "--shuffle-seed",
             metavar="SEED",
             type=float,
@@ -183,16 +353,16 @@ Test filter, runs tests that match ALL of the given tags.
             "reproduce a particular order.",
         )
 
-        report_group = parser.add_argument_group("Reporting")
-
-        report_group.add_argument(
+    def _build_report(self, group) -> None:
+        """Adds the Reporting argument group options."""
+        group.add_argument(
             "--stdout-style",
             **styles.StyleArg.get_parser_context(
                 default=self._default_options["stdout_style"]
             )
         )
 
-        report_group.add_argument(
+        group.add_argument(
             "--pdf",
             dest="pdf_path",
             default=self._default_options["pdf_path"],
@@ -200,7 +370,7 @@ Test filter, runs tests that match ALL of the given tags.
             help="Path for PDF report.",
         )
 
-        report_group.add_argument(
+        group.add_argument(
             "--json",
             dest="json_path",
             default=self._default_options["json_path"],
@@ -208,7 +378,7 @@ Test filter, runs tests that match ALL of the given tags.
             help="Path for JSON report.",
         )
 
-        report_group.add_argument(
+        group.add_argument(
             "--xml",
             dest="xml_dir",
             default=self._default_options["xml_dir"],
@@ -216,7 +386,7 @@ Test filter, runs tests that match ALL of the given tags.
             help="Directory path for XML reports.",
         )
 
-        report_group.add_argument(
+        group.add_argument(
             "--http",
             dest="http_url",
             default=self._default_options["http_url"],
@@ -224,21 +394,21 @@ Test filter, runs tests that match ALL of the given tags.
             help="Web URL for posting report.",
         )
 
-        report_group.add_argument(
+        group.add_argument(
             "--report-dir",
             default=self._default_options["report_dir"],
             metavar="PATH",
             help="Target directory for tag filtered report output.",
         )
 
-        report_group.add_argument(
+        group.add_argument(
             "--pdf-style",
             **styles.StyleArg.get_parser_context(
                 default=self._default_options["pdf_style"]
             )
         )
 
-        report_group.add_argument(
+        group.add_argument(
             "-v",
             "--verbose",
             action="store_true",
@@ -247,7 +417,7 @@ Test filter, runs tests that match ALL of the given tags.
             'option to "detailed".',
         )
 
-        report_group.add_argument(
+        group.add_argument(
             "-d",
             "--debug",
             action="store_true",
@@ -255,7 +425,7 @@ Test filter, runs tests that match ALL of the given tags.
             help="Enables debug mode.",
         )
 
-        report_group.add_argument(
+        group.add_argument(
             "-b",
             "--browse",
             action="store_true",
@@ -266,7 +436,7 @@ Test filter, runs tests that match ALL of the given tags.
             "will be nothing to open.",
         )
 
-        report_group.add_argument(
+        group.add_argument(
             "-u",
             "--ui",
             dest="ui_port",
@@ -279,7 +449,7 @@ Test filter, runs tests that match ALL of the given tags.
             "saved locally.".format(self._default_options["ui_port"]),
         )
 
-        report_group.add_argument(
+        group.add_argument(
             "--report-tags",
             nargs="+",
             action=ReportTagsAction,
@@ -293,7 +463,7 @@ that match ANY of the given tags.
 --report-tags <tag_name_1> <tag_category_1>=<tag_name_2>""",
         )
 
-        report_group.add_argument(
+        group.add_argument(
             "--report-tags-all",
             nargs="+",
             action=ReportTagsAction,
@@ -307,7 +477,7 @@ that match ALL of the given tags.
 --report-tags-all <tag_name_1> <tag_category_1>=<tag_name_2>""",
         )
 
-        report_group.add_argument(
+        group.add_argument(
             "--file-log-level",
             choices=LogLevelAction.LEVELS.keys(),
             default=self._default_options["file_log_level"],
@@ -315,21 +485,51 @@ that match ALL of the given tags.
             help="Specifies log level for file logs. Set to None to disable "
             "file logging.",
         )
-        report_group.add_argument(
+        group.add_argument(
             "--label",
             default=None,
             help="Labels the test report with the given name, "
             'useful to categorize or classify similar reports (aka "run-id").',
         )
 
-        self.add_arguments(parser)
-        return parser
-
     def parse_args(self):
         """
-        Generates the parser & return parsed command line args.
+        Generates the parser (once) & return parsed command line args.
+        """
+        groups = self._required_groups(sys.argv[1:])
+        if self._parser is None or not groups <= self._parser_groups:
+            self._parser = self._generate_parser(groups)
+            self._parser_groups = groups
+        try:
+            return self._parser.parse_args()
+        except _PartialParserError:
+            # Parse again with every group, so that the error output does not
+            # depend on which options were given.
+            groups = frozenset(
+                title for title, _, _ in self._argument_groups()
+            )
+            self._parser = self._generate_parser(groups)
+            self._parser_groups = groups
+            return self._parser.parse_args()
+
+    def _generate_parser(self, groups) -> HelpParser:
+        """
+        Generates a parser with the given argument groups. The groups are
+        handed over through an attribute and `generate_parser` is called
+        without arguments, so that subclasses overriding
+        `generate_parser(self)` keep working.
+
+        :param groups: titles of the argument groups to build
         """
-        return self.generate_parser().parse_args()
+        self._requested_groups = groups
+        try:
+            parser = self.generate_parser()
+        finally:
+            self._requested_groups = None
+        parser.partial = not groups.issuperset(
+            title for title, _, _ in self._argument_groups()
+        )
+        return parser
 
     def process_args(self, namespace: argparse.Namespace) -> Dict:
         """
@@ -342,14 +542,16 @@ that match ALL of the given tags.
         :param namespace: namespace of parsed arguments
         :return: initial configuration
         """
-        args = dict(**vars(namespace))
+        args = vars(namespace).copy()
 
-        filter_args = filtering.parse_filter_args(
-            parsed_args=args, arg_names=("tags", "tags_all", "patterns")
-        )
+        # Skip filter parsing on the common path where no filter is given
+        if any(args.get(name) for name in _FILTER_ARG_NAMES):
+            filter_args = filtering.parse_filter_args(
+                parsed_args=args, arg_names=_FILTER_ARG_NAMES
+            )
 
-        if filter_args:
-            args["test_filter"] = filter_args
+            if filter_args:
+                args["test_filter"] = filter_args
 
         # Cmdline supports shuffle ordering only for now
         if args.get("shuffle"):
@@ -361,15 +563,14 @@ that match ALL of the given tags.
         # verbose/debug parameters. Debug output should be a superset of
         # verbose output, i.e. running with just "-d" should automatically
         # give you all "-v" output plus extra DEBUG logs.
-        if args["verbose"] or args["debug"]:
-            args["stdout_style"] = styles.Style(
-                styles.StyleEnum.ASSERTION_DETAIL,
-                styles.StyleEnum.ASSERTION_DETAIL,
-            )
-            if args["debug"]:
-                args["logger_level"] = logger.DEBUG
-            elif args["verbose"]:
-                args["logger_level"] = logger.INFO
+        level = (
+            logger.DEBUG
+            if args["debug"]
+            else (logger.INFO if args["verbose"] else None)
+        )
+        if level is not None:
+            args["stdout_style"] = _DETAIL_STYLE
+            args["logger_level"] = level
 
         if args["list"] and not args["test_lister"]:
             args["test_lister"] = listing.NameLister()
@@ -263,13 +263,21 @@ class Task:
                     )
             return tgt
 
-    def dumps(self, check_loadable=False):
-        """Serialize a task."""
+    def dumps(self, check_loadable=False, protocol=None):
+        """
+        Serialize a task.
+
+        :param check_loadable: Check that the serialized task can be loaded.
+        :type check_loadable: ``bool``
+        :param protocol: Pickle protocol to use, defaults to
+            ``pickle.DEFAULT_PROTOCOL``.
+        :type protocol: ``int``
+        """
         data = {}
         for attr in self.all_attrs:
             data[attr] = getattr(self, attr)
         try:
-            serialized = pickle.dumps(data)
+            serialized = pickle.dumps(data, protocol=protocol)
             if check_loadable is True:
                 pickle.loads(serialized)
             return serialized
@@ -16,7 +16,6 @@ from typing import Callable, Optional
 import functools
 
 from testplan import defaults
-from testplan.common.utils.package import MOD_LOCK
 from testplan.common.utils import comparison
 from testplan.common.utils import strings
 from testplan.defaults import STDOUT_STYLE
@@ -29,6 +28,24 @@ from .entries.stdout.base import registry as stdout_registry
 IS_WIN = platform.system() == "Windows"
 
 
+def _source_path(filename: str) -> str:
+    """
+    Absolute path of a code object's source file, assertions are made from a
+    handful of files so absolute ones are only normalized once per file.
+    Relative filenames depend on the current working directory and are
+    resolved on every call.
+    """
+    if os.path.isabs(filename):
+        return _normalized_path(filename)
+    return os.path.abspath(filename)
+
+
+@functools.lru_cache(maxsize=None)
+def _normalized_path(filename: str) -> str:
+    """Normalized form of an absolute path."""
+    return os.path.abspath(filename)
+
+
 class ExceptionCapture:
     """
     Exception capture scope, will be used by exception related assertions.
@@ -83,12 +100,14 @@ class ExceptionCapture:
             description=self.description,
         )
 
-        with MOD_LOCK:
-            # TODO: see https://github.com/python/cpython/commit/85cf1d514b84dc9a4bcb40e20a12e1d82ff19f20
-            caller_frame = inspect.stack()[1]
-
-        exc_assertion.file_path = os.path.abspath(caller_frame[1])
-        exc_assertion.line_no = caller_frame[2]
+        caller_frame = inspect.currentframe().f_back
+        try:
+            exc_assertion.file_path = _source_path(
+                caller_frame.f_code.co_filename
+            )
+            exc_assertion.line_no = caller_frame.f_lineno
+        finally:
+            del caller_frame
 
         # We cannot use `bind_entry` here as this block will
         # be run when an exception is raised
@@ -155,27 +174,25 @@ def assertion(func: Callable) -> Callable:
             custom_style = kwargs.pop("custom_style", None)
             entry = func(result, *args, **kwargs)
             if top_assertion:
-                with MOD_LOCK:
-                    call_stack = inspect.stack()
-                    try:
-                        if getattr(assertion_state, "filepath", None) is None:
-                            frame = call_stack[1]
-                        else:
-                            for frame in call_stack:
-                                if (
-                                    frame.filename == assertion_state.filepath
-                                    and frame.lineno
-                                    in assertion_state.line_range
-                                ):
-                                    break
-                            else:
-                                frame = call_stack[1]
-                        entry.file_path = os.path.abspath(frame.filename)
-                        entry.line_no = frame.lineno
-                    finally:
-                        # https://docs.python.org/3/library/inspect.html
-                        del frame
-                        del call_stack
+                # Walk the frames directly, ``inspect.stack`` would read
+                # the source context of every frame on the stack.
+                frame = caller = inspect.currentframe().f_back
+                try:
+                    if getattr(assertion_state, "filepath", None) is not None:
+                        while frame is not None and not (
+                            frame.f_code.co_filename
+                            == assertion_state.filepath
+                            and frame.f_lineno in assertion_state.line_range
+                        ):
+                            frame = frame.f_back
+                        if frame is None:
+                            frame = caller
+                    entry.file_path = _source_path(frame.f_code.co_filename)
+                    entry.line_no = frame.f_lineno
+                finally:
+                    # https://docs.python.org/3/library/inspect.html
+                    del frame
+                    del caller
 
                 if custom_style is not None:
                     if not isinstance(custom_style, dict):
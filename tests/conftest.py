@@ -1,6 +1,7 @@
 """Shared PyTest fixtures."""
 
 import os
+import shutil
 import sys
 import tempfile
 
@@ -20,19 +21,30 @@ from testplan.common.utils.path import VAR_TMP
 # it will be the parent directory of all those temporary `runpath`.
 
 
-def _generate_runpath():
+def _generate_runpath(root):
     """
     Generate a temporary directory unless specified by environment variable.
     """
     if os.environ.get("TEST_ROOT_RUNPATH"):
         yield tempfile.mkdtemp(dir=os.environ["TEST_ROOT_RUNPATH"])
     else:
-        parent_runpath = (
-            VAR_TMP if os.name == "posix" and os.path.exists(VAR_TMP) else None
-        )
+        runpath = tempfile.mkdtemp(dir=root)
         # The path will be automatically removed after the test
-        with tempfile.TemporaryDirectory(dir=parent_runpath) as runpath:
-            yield runpath
+        yield runpath
+        shutil.rmtree(runpath, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def runpath_root():
+    """
+    Return a temporary directory under which the `runpath` series fixtures
+    create their paths, it is removed at the end of the test session.
+    """
+    parent_runpath = (
+        VAR_TMP if os.name == "posix" and os.path.exists(VAR_TMP) else None
+    )
+    with tempfile.TemporaryDirectory(dir=parent_runpath) as root:
+        yield root
 
 
 # For `runpath` series fixtures, We were originally using a pytest builtin
@@ -42,27 +54,27 @@ def _generate_runpath():
 
 
 @pytest.fixture(scope="function")
-def runpath():
+def runpath(runpath_root):
     """
     Return a temporary runpath for testing (function level).
     """
-    yield from _generate_runpath()
+    yield from _generate_runpath(runpath_root)
 
 
 @pytest.fixture(scope="class")
-def runpath_class():
+def runpath_class(runpath_root):
     """
     Return a temporary runpath for testing (class level).
     """
-    yield from _generate_runpath()
+    yield from _generate_runpath(runpath_root)
 
 
 @pytest.fixture(scope="module")
-def runpath_module():
+def runpath_module(runpath_root):
     """
     Return a temporary runpath for testing (module level).
     """
-    yield from _generate_runpath()
+    yield from _generate_runpath(runpath_root)
 
 
 @pytest.fixture(scope="function")
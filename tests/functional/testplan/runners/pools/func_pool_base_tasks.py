@@ -1,14 +1,11 @@
 """Base Testplan Tasks shared by different functional tests."""
 
 import os
-from pathlib import Path
-
-import psutil
 import tempfile
-
+from pathlib import Path
 
 from testplan.report import Status
-from testplan.common.utils.path import fix_home_prefix
+from testplan.common.utils.path import fix_home_prefix, is_subdir
 from testplan.testing.multitest import MultiTest, testsuite, testcase
 from testplan.testing.multitest.base import MultiTestConfig
 from testplan.common.utils.strings import slugify
@@ -35,14 +32,18 @@ class MySuite:
         os.remove(tmpfile.name)
 
 
+# MySuite holds no state, all scheduled multitests can share one instance
+_SHARED_SUITE = MySuite()
+
+
 def get_mtest(name):
     """TODO."""
-    return MultiTest(name="MTest{}".format(name), suites=[MySuite()])
+    return MultiTest(name=f"MTest{name}", suites=[_SHARED_SUITE])
 
 
 def get_mtest_imported(name):
     """TODO."""
-    return MultiTest(name="MTest{}".format(name), suites=[MySuite()])
+    return MultiTest(name=f"MTest{name}", suites=[_SHARED_SUITE])
 
 
 @testsuite
@@ -129,19 +130,20 @@ def schedule_tests_to_pool(plan, pool, schedule_path=None, **pool_cfg):
     # 2 testcase * 9 iterations
     assert plan.report.counter == {"passed": 18, "total": 18, "failed": 0}
 
-    names = sorted(["MTest{}".format(x) for x in range(1, 10)])
-    assert sorted([entry.name for entry in plan.report.entries]) == names
+    names = {f"MTest{x}" for x in range(1, 10)}
+    assert {entry.name for entry in plan.report.entries} == names
 
     assert isinstance(plan.report.serialize(), dict)
 
     for idx in range(1, 10):
-        name = "MTest{}".format(idx)
+        name = f"MTest{idx}"
         assert plan.result.test_results[uids[idx - 1]].report.name == name
 
-    # check attachment exists in local
-    assert os.path.exists(
-        plan.report.entries[0].entries[0].entries[1].entries[0]["source_path"]
-    )
+    # check attachment exists in local, as a copy under the plan runpath
+    # rather than the file written by `test_attach` which outlives the test
+    attachment = plan.report.entries[0].entries[0].entries[1].entries[0]
+    assert os.path.exists(attachment["source_path"])
+    assert is_subdir(attachment["source_path"], plan.runpath)
 
     # All tasks assigned once
     for uid in pool._task_retries_cnt:
@@ -156,4 +158,4 @@ def target_raises_in_worker(parent_pid):
     if os.getpid() != parent_pid:
         raise RuntimeError("Materialization failed in worker")
 
-    return MultiTest(name="MTest", suites=[MySuite()])
+    return MultiTest(name="MTest", suites=[_SHARED_SUITE])
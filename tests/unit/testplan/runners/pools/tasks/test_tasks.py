@@ -1,6 +1,12 @@
 """Unit test for task classes."""
 
-import os
+import pickle
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
 from testplan.runners.pools.tasks import (
     Task,
     RunnableTaskAdaptor,
@@ -13,12 +19,14 @@ from testplan.runners.pools.tasks import (
 class NonRunnableObject:
     """Non runnable."""
 
-    pass
+    __slots__ = ()
 
 
 class NonRunnableObjectRunAttr:
     """Non runnable."""
 
+    __slots__ = ("run",)
+
     def __init__(self):
         """TODO."""
         self.run = None
@@ -27,6 +35,8 @@ class NonRunnableObjectRunAttr:
 class RunnableThatRaises:
     """Runnable that raises while running."""
 
+    __slots__ = ()
+
     def run(self):
         """Run method."""
         raise RuntimeError("While running.")
@@ -39,10 +49,10 @@ class RunnableThatRaises:
 class Runnable:
     """Runnable."""
 
+    __slots__ = ()
+
     def run(self):
         """Run method."""
-        import sys
-
         return sys.maxsize
 
     def uid(self):
@@ -53,14 +63,14 @@ class Runnable:
 class RunnableWithArg:
     """Runnable."""
 
+    __slots__ = ("_number",)
+
     def __init__(self, number=None):
         """Init."""
         self._number = number
 
     def run(self):
         """Run method."""
-        import sys
-
         return self._number or sys.maxsize
 
     def uid(self):
@@ -80,7 +90,6 @@ def callable_to_runnable_with_arg(arg):
 
 def callable_to_non_runnable():
     """Task target that returns non runnable."""
-    import sys
 
     def function():
         """Callable."""
@@ -96,8 +105,6 @@ def callable_to_none():
 
 def callable_to_adapted_runnable():
     """TODO."""
-    import sys
-    from testplan.runners.pools.tasks import RunnableTaskAdaptor
 
     def foo():
         """Callable."""
@@ -106,13 +113,170 @@ def callable_to_adapted_runnable():
     return RunnableTaskAdaptor(foo)
 
 
-def materialized_task_result(task, expected, serialize=False):
+@pytest.fixture(scope="session")
+def sample_tasks():
+    """
+    Sample tasks module, imported once per test session.
+    ``data.sample_tasks`` re-exports it so both are interchangeable.
+    """
+    from .data.relative import sample_tasks
+
+    return sample_tasks
+
+
+@pytest.fixture(scope="session")
+def multiplier_2_3(sample_tasks):
+    """Sample ``Multiplier`` runnable, built once per test session."""
+    return sample_tasks.Multiplier(2, 3)
+
+
+_NON_RUNNABLE_CASES = (
+    pytest.param(NonRunnableObject, id="class-no-run-uid"),
+    pytest.param(NonRunnableObject(), id="instance-no-run-uid"),
+    pytest.param(NonRunnableObjectRunAttr, id="class-run-attr"),
+    pytest.param(NonRunnableObjectRunAttr(), id="instance-run-attr"),
+)
+
+_MISSING_METHODS_RE = re.compile(r"must have both `run` and `uid` methods")
+_CANNOT_GET_RE = re.compile(r"Cannot get a valid test object from target")
+
+_HERE = Path(__file__).resolve().parent
+_DATA = _HERE / "data"
+_RELATIVE = _DATA / "relative"
+_SAMPLE_TASKS_MODULE = (
+    "tests.unit.testplan.runners.pools.tasks.data.sample_tasks"
+)
+_RELATIVE_MODULE = "tests.unit.testplan.runners.pools.tasks.data.relative"
+
+# (target, module, path, args, kwargs, expected)
+STRING_TARGET_CASES = [
+    pytest.param(
+        "Multiplier",
+        _SAMPLE_TASKS_MODULE,
+        None,
+        (4,),
+        {},
+        8,
+        id="class",
+    ),
+    pytest.param(
+        "Wrapper.InnerMultiplier",
+        _SAMPLE_TASKS_MODULE,
+        None,
+        (5,),
+        {},
+        10,
+        id="inner-class",
+    ),
+    pytest.param(
+        "sample_tasks.Multiplier",
+        _RELATIVE_MODULE,
+        None,
+        (4,),
+        {"multiplier": 3},
+        12,
+        id="package-class",
+    ),
+    pytest.param(
+        "sample_tasks.Wrapper.InnerMultiplier",
+        _RELATIVE_MODULE,
+        None,
+        (5,),
+        {"multiplier": 3},
+        15,
+        id="package-inner-class",
+    ),
+    pytest.param(
+        "Multiplier",
+        "relative.sample_tasks",
+        str(_DATA),
+        (4,),
+        {},
+        8,
+        id="path-package-class",
+    ),
+    pytest.param(
+        "callable_to_runnable",
+        "relative.sample_tasks",
+        str(_DATA),
+        (2,),
+        {},
+        4,
+        id="path-package-callable",
+    ),
+    pytest.param(
+        "Multiplier",
+        "sample_tasks",
+        str(_RELATIVE),
+        (4,),
+        {},
+        8,
+        id="path-class",
+    ),
+    pytest.param(
+        "callable_to_runnable",
+        "sample_tasks",
+        str(_RELATIVE),
+        (2,),
+        {},
+        4,
+        id="path-callable",
+    ),
+]
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        pytest.param(protocol, id=f"protocol-{protocol}")
+        for protocol in sorted(
+            {pickle.DEFAULT_PROTOCOL, pickle.HIGHEST_PROTOCOL, 5}
+        )
+        if protocol <= pickle.HIGHEST_PROTOCOL
+    ],
+)
+def pickle_protocol(request):
+    """Pickle protocols supported by the running interpreter."""
+    return request.param
+
+
+@pytest.fixture(
+    scope="module",
+    params=(
+        pytest.param(lambda: Task("Runnable", module=__name__), id="class"),
+        pytest.param(
+            lambda: Task("RunnableWithArg", module=__name__, args=(2,)),
+            id="class-args",
+        ),
+        pytest.param(
+            lambda: Task(
+                "RunnableWithArg", module=__name__, kwargs={"number": 3}
+            ),
+            id="class-kwargs",
+        ),
+        pytest.param(
+            lambda: Task(
+                "Multiplier",
+                module="sample_tasks",
+                args=(4,),
+                path=str(_RELATIVE),
+            ),
+            id="path-class",
+        ),
+    ),
+)
+def serialized_task(request, pickle_protocol):
+    """
+    Sample task & its serialized form, each task is serialized once and
+    shared by the tests of this module.
+    """
+    task = request.param()
+    return task, task.dumps(protocol=pickle_protocol)
+
+
+def materialized_task_result(task, expected):
     """TODO."""
-    assert isinstance(task, Task)
     materialized = task.materialize()
-    if serialize is True:
-        serialized = task.dumps()
-        task = Task().loads(serialized)
     assert materialized.run() == expected
 
 
@@ -120,31 +284,18 @@ def materialized_task_result(task, expected, serialize=False):
 class TestTaskInitAndMaterialization:
     """TODO."""
 
-    def test_non_runnable_tgt(self):
-        """TODO."""
-        for task in (
-            NonRunnableObject,
-            NonRunnableObject(),
-            NonRunnableObjectRunAttr,
-            NonRunnableObjectRunAttr(),
-        ):
-            try:
-                Task(task).materialize()
-            except RuntimeError as exc:
-                assert "must have both `run` and `uid` methods" in str(exc)
-
-    def test_runnable_tgt(self):
+    @pytest.mark.parametrize("target", _NON_RUNNABLE_CASES)
+    def test_non_runnable_tgt(self, target):
         """TODO."""
-        import sys
-        from .data.sample_tasks import Multiplier
+        with pytest.raises(RuntimeError, match=_MISSING_METHODS_RE):
+            Task(target).materialize()
 
-        try:
+    def test_runnable_tgt(self, multiplier_2_3):
+        """TODO."""
+        with pytest.raises(RuntimeError, match=r"^While running\.$"):
             materialized_task_result(Task(RunnableThatRaises()), 2)
-            raise Exception("Should raise")
-        except RuntimeError as exc:
-            assert "While running." == str(exc)
 
-        materialized_task_result(Task(Multiplier(2, 3)), 6)
+        materialized_task_result(Task(multiplier_2_3), 6)
         materialized_task_result(Task(Runnable()), sys.maxsize)
         materialized_task_result(Task(RunnableWithArg(2)), 2)
         task = Task(RunnableTaskAdaptor(lambda x: x * 2, 3))
@@ -152,8 +303,6 @@ class TestTaskInitAndMaterialization:
 
     def test_string_runnable_tgt_same_module(self):
         """TODO."""
-        import sys
-
         task = Task("Runnable", module=__name__)
         materialized_task_result(task, sys.maxsize)
 
@@ -163,100 +312,91 @@ class TestTaskInitAndMaterialization:
         task = Task("RunnableWithArg", module=__name__, kwargs={"number": 3})
         materialized_task_result(task, 3)
 
-    def test_string_runnable_tgt_other_module(self):
-        """TODO."""
-        task = Task(
-            "Multiplier",
-            module="tests.unit.testplan.runners.pools.tasks.data.sample_tasks",
-            args=(4,),
-        )
-        materialized_task_result(task, 8)
-
-        task = Task(
-            "Wrapper.InnerMultiplier",
-            module="tests.unit.testplan.runners.pools.tasks.data.sample_tasks",
-            args=(5,),
-        )
-        materialized_task_result(task, 10)
-
-        task = Task(
-            "sample_tasks.Multiplier",
-            module="tests.unit.testplan.runners.pools.tasks.data.relative",
-            args=(4,),
-            kwargs={"multiplier": 3},
-        )
-        materialized_task_result(task, 12)
-
-        task = Task(
-            "sample_tasks.Wrapper.InnerMultiplier",
-            module="tests.unit.testplan.runners.pools.tasks.data.relative",
-            args=(5,),
-            kwargs={"multiplier": 3},
-        )
-        materialized_task_result(task, 15)
-
-    def test_callable_to_non_runnable_tgt(self):
-        """TODO."""
-        from .data.relative import sample_tasks
-
-        for task in (
-            Task(callable_to_non_runnable),
-            Task(sample_tasks.callable_to_non_runnable, args=(2,)),
-            Task(
-                "multiply",
-                module=(
-                    "tests.unit.testplan.runners.pools.tasks.data.sample_tasks"
+    @pytest.mark.parametrize(
+        "target, module, path, args, kwargs, expected", STRING_TARGET_CASES
+    )
+    def test_string_runnable(
+        self, target, module, path, args, kwargs, expected
+    ):
+        """
+        String targets resolved from a dotted module or, when a path is
+        given, from a module importable under that path materialize into
+        runnables returning the expected value.
+        """
+        task = Task(target, module=module, path=path, args=args, kwargs=kwargs)
+        materialized_task_result(task, expected)
+
+    @pytest.mark.parametrize(
+        "task_factory",
+        (
+            pytest.param(
+                lambda sample_tasks: Task(callable_to_non_runnable),
+                id="callable",
+            ),
+            pytest.param(
+                lambda sample_tasks: Task(
+                    sample_tasks.callable_to_non_runnable, args=(2,)
+                ),
+                id="other-module-callable",
+            ),
+            pytest.param(
+                lambda sample_tasks: Task(
+                    "multiply", module=_SAMPLE_TASKS_MODULE, args=(2,)
                 ),
-                args=(2,),
+                id="string",
             ),
-            Task(
-                "sample_tasks.multiply",
-                module="tests.unit.testplan.runners.pools.tasks.data.relative",
-                args=(2,),
+            pytest.param(
+                lambda sample_tasks: Task(
+                    "sample_tasks.multiply", module=_RELATIVE_MODULE, args=(2,)
+                ),
+                id="package-string",
             ),
-        ):
-            try:
-                task.materialize()
-                raise Exception("Should raise.")
-            except RuntimeError as exc:
-                assert "must have both `run` and `uid` methods" in str(exc)
-
-    def test_callable_to_none(self):
+        ),
+    )
+    def test_callable_to_non_runnable_tgt(self, task_factory, sample_tasks):
         """TODO."""
-        from .data.relative import sample_tasks
-
-        for task in (
-            Task(callable_to_none),
-            Task(sample_tasks.callable_to_none),
-            Task(
-                "callable_to_none",
-                module=(
-                    "tests.unit.testplan.runners.pools.tasks.data.sample_tasks"
+        task = task_factory(sample_tasks)
+        with pytest.raises(RuntimeError, match=_MISSING_METHODS_RE):
+            task.materialize()
+
+    @pytest.mark.parametrize(
+        "task_factory",
+        (
+            pytest.param(
+                lambda sample_tasks: Task(callable_to_none), id="callable"
+            ),
+            pytest.param(
+                lambda sample_tasks: Task(sample_tasks.callable_to_none),
+                id="other-module-callable",
+            ),
+            pytest.param(
+                lambda sample_tasks: Task(
+                    "callable_to_none", module=_SAMPLE_TASKS_MODULE
                 ),
+                id="string",
             ),
-            Task(
-                "sample_tasks.callable_to_none",
-                module="tests.unit.testplan.runners.pools.tasks.data.relative",
+            pytest.param(
+                lambda sample_tasks: Task(
+                    "sample_tasks.callable_to_none", module=_RELATIVE_MODULE
+                ),
+                id="package-string",
             ),
-        ):
-            try:
-                task.materialize()
-                raise Exception("Should raise.")
-            except TaskMaterializationError as exc:
-                assert "Cannot get a valid test object from target" in str(exc)
-
-    def test_callable_to_runnable_tgt(self):
+        ),
+    )
+    def test_callable_to_none(self, task_factory, sample_tasks):
         """TODO."""
-        import sys
+        task = task_factory(sample_tasks)
+        with pytest.raises(TaskMaterializationError, match=_CANNOT_GET_RE):
+            task.materialize()
 
+    def test_callable_to_runnable_tgt(self, sample_tasks):
+        """TODO."""
         task = Task(callable_to_runnable)
         materialized_task_result(task, sys.maxsize)
 
         task = Task(callable_to_runnable_with_arg, args=(2,))
         materialized_task_result(task, 2)
 
-        from .data import sample_tasks
-
         task = Task(sample_tasks.callable_to_runnable, args=(2,))
         materialized_task_result(task, 4)
 
@@ -265,8 +405,6 @@ class TestTaskInitAndMaterialization:
 
     def test_string_callable_to_runnable_tgt(self):
         """TODO."""
-        import sys
-
         task = Task("callable_to_runnable", module=__name__)
         materialized_task_result(task, sys.maxsize)
 
@@ -276,44 +414,14 @@ class TestTaskInitAndMaterialization:
         materialized_task_result(task, 2)
 
         task = Task(
-            "callable_to_runnable",
-            module="tests.unit.testplan.runners.pools.tasks.data.sample_tasks",
-            args=(2,),
+            "callable_to_runnable", module=_SAMPLE_TASKS_MODULE, args=(2,)
         )
         materialized_task_result(task, 4)
 
         task = Task(
             "sample_tasks.callable_to_adapted_runnable",
-            module="tests.unit.testplan.runners.pools.tasks.data.relative",
-            args=(2,),
-        )
-        materialized_task_result(task, 4)
-
-    def test_path_usage(self):  # pylint: disable=R0201
-        """TODO."""
-        dirname = os.path.dirname(os.path.abspath(__file__))
-        path = os.path.join(dirname, "data")
-
-        task = Task(
-            "Multiplier", module="relative.sample_tasks", args=(4,), path=path
-        )
-        materialized_task_result(task, 8)
-
-        task = Task(
-            "callable_to_runnable",
-            module="relative.sample_tasks",
+            module=_RELATIVE_MODULE,
             args=(2,),
-            path=path,
-        )
-        materialized_task_result(task, 4)
-
-        path = os.path.join(path, "relative")
-
-        task = Task("Multiplier", module="sample_tasks", args=(4,), path=path)
-        materialized_task_result(task, 8)
-
-        task = Task(
-            "callable_to_runnable", module="sample_tasks", args=(2,), path=path
         )
         materialized_task_result(task, 4)
 
@@ -322,40 +430,30 @@ class TestTaskInitAndMaterialization:
 class TestTaskSerialization:
     """TODO."""
 
-    def test_serialize(self):
-        """TODO."""
-        import sys
-
-        task = Task("Runnable", module=__name__)
-        materialized_task_result(task, sys.maxsize, serialize=True)
-
-        task = Task("RunnableWithArg", module=__name__, args=(2,))
-        materialized_task_result(task, 2, serialize=True)
-
-        task = Task("RunnableWithArg", module=__name__, kwargs={"number": 3})
-        materialized_task_result(task, 3, serialize=True)
-
-        dirname = os.path.dirname(os.path.abspath(__file__))
-        path = os.path.join(dirname, "data", "relative")
-        task = Task("Multiplier", module="sample_tasks", args=(4,), path=path)
-        materialized_task_result(task, 8, serialize=True)
+    def test_roundtrip_bytes_are_valid(self, serialized_task, pickle_protocol):
+        """
+        Serialized tasks are pickled with the requested protocol and load
+        back with the same attributes.
+        """
+        task, serialized = serialized_task
+        # Protocol 2+ pickles start with the PROTO opcode & protocol number
+        assert serialized[0] == pickle.PROTO[0]
+        assert serialized[1] == pickle_protocol
+        loaded = Task().loads(serialized)
+        assert isinstance(loaded, Task)
+        for attr in task.all_attrs:
+            assert getattr(loaded, attr) == getattr(task, attr)
 
     def test_raise_on_serialization(self):
         """TODO."""
-        try:
-            task = Task(RunnableTaskAdaptor(lambda x: x * 2, 3))
-            materialized_task_result(task, 6, serialize=True)
-            raise Exception("Should raise.")
-        except TaskSerializationError:
-            pass
+        task = Task(RunnableTaskAdaptor(lambda x: x * 2, 3))
+        with pytest.raises(TaskSerializationError):
+            task.dumps()
 
     def test_raise_on_deserialization(self):
         """TODO."""
         # To add a case of a serializable but not
         # deserializable task.
 
-        try:
+        with pytest.raises(TaskDeserializationError):
             Task().loads(None)
-            raise Exception("Should raise.")
-        except TaskDeserializationError:
-            pass
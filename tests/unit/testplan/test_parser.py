@@ -0,0 +1,217 @@
+"""Unit tests for the command line parser of Testplan."""
+
+import argparse
+import sys
+
+import pytest
+
+from testplan.common.utils import logger
+from testplan.common.utils.testing import argv_overridden
+from testplan.parser import LogLevelAction, TestplanParser, _ArgumentDefaults
+from testplan.report.testing import styles
+
+
+def test_parser_cached(mockplan):
+    parser = mockplan.parser
+
+    with argv_overridden("--pdf", "first.pdf"):
+        args = parser.parse_args()
+        generated = parser._parser
+        assert args.pdf_path == "first.pdf"
+
+    with argv_overridden("--pdf", "second.pdf"):
+        args = parser.parse_args()
+        assert parser._parser is generated
+        assert args.pdf_path == "second.pdf"
+
+
+def test_process_args_no_filter(mockplan):
+    parser = mockplan.parser
+
+    with argv_overridden():
+        args = parser.process_args(parser.parse_args())
+    assert "test_filter" not in args
+
+    with argv_overridden("--patterns", "MTest"):
+        args = parser.process_args(parser.parse_args())
+    assert args["test_filter"] is not None
+
+
+@pytest.mark.parametrize(
+    "argv, groups",
+    (
+        ([], set()),
+        (["--pdf", "report.pdf", "-v"], {"Reporting"}),
+        (
+            ["--shuffle", "suites", "--patterns", "MTest"],
+            {"Ordering", "Filtering"},
+        ),
+        (["--timeout=10"], {"General"}),
+        (["-h"], {"General", "Filtering", "Ordering", "Reporting"}),
+        (["--verb"], {"General", "Filtering", "Ordering", "Reporting"}),
+    ),
+)
+def test_required_groups(mockplan, argv, groups):
+    assert mockplan.parser._required_groups(argv) == groups
+
+
+def test_parse_args_scans_argv_once(mockplan, monkeypatch):
+    parser = mockplan.parser
+    required_groups = type(parser)._required_groups
+    calls = []
+
+    def counting_required_groups(self, argv):
+        calls.append(argv)
+        return required_groups(self, argv)
+
+    monkeypatch.setattr(
+        type(parser), "_required_groups", counting_required_groups
+    )
+    with argv_overridden("--pdf", "report.pdf"):
+        parser.parse_args()
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    ({}, {"timeout": "30", "shuffle_seed": "1.5", "interactive_port": "80"}),
+)
+def test_lazy_groups_defaults(mockplan, overrides):
+    parser = TestplanParser(
+        "plan", dict(mockplan.parser._default_options, **overrides)
+    )
+    all_groups = {title for title, _, _ in parser._argument_groups()}
+
+    with argv_overridden("--pdf", "report.pdf"):
+        lazy = parser.generate_parser().parse_args()
+        full = parser.generate_parser(all_groups).parse_args()
+    assert vars(lazy) == vars(full)
+
+
+@pytest.mark.parametrize(
+    "option, kwargs",
+    (
+        ("--flag", {"action": "store_true"}),
+        ("--no-flag", {"action": "store_false"}),
+        ("--count", {"action": "count"}),
+        ("--number", {"type": int, "default": "5"}),
+        ("--ratio", {"type": float, "default": 0.5}),
+        ("--name", {"default": "name"}),
+        ("--hidden", {"default": argparse.SUPPRESS}),
+        ("--some-path", {"dest": "path", "default": None}),
+    ),
+)
+def test_argument_defaults_match_argparse(option, kwargs):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(option, **kwargs)
+    arg_defaults = _ArgumentDefaults()
+    arg_defaults.add_argument(option, **kwargs)
+
+    assert arg_defaults == vars(parser.parse_args([]))
+
+
+def test_parse_args_legacy_generate_parser(mockplan):
+    class LegacyParser(TestplanParser):
+        def generate_parser(self):
+            return super().generate_parser()
+
+    parser = LegacyParser("plan", mockplan.parser._default_options)
+    with argv_overridden("--pdf", "report.pdf"):
+        assert parser.parse_args().pdf_path == "report.pdf"
+
+
+@pytest.mark.parametrize(
+    "argv, level",
+    (
+        (["-v"], logger.INFO),
+        (["-d"], logger.DEBUG),
+        (["-v", "-d"], logger.DEBUG),
+    ),
+)
+def test_process_args_verbosity(mockplan, argv, level):
+    parser = mockplan.parser
+
+    with argv_overridden(*argv):
+        args = parser.process_args(parser.parse_args())
+    assert args["logger_level"] == level
+    assert args["stdout_style"] == styles.Style(
+        styles.StyleEnum.ASSERTION_DETAIL, styles.StyleEnum.ASSERTION_DETAIL
+    )
+
+
+def test_process_args_no_verbosity(mockplan):
+    parser = mockplan.parser
+
+    with argv_overridden():
+        args = parser.process_args(parser.parse_args())
+    assert "logger_level" not in args
+
+
+def test_error_without_tty(mockplan, capsys):
+    parser = mockplan.parser
+
+    with argv_overridden("--timeout", "not-a-number"):
+        with pytest.raises(SystemExit) as exc_info:
+            parser.parse_args()
+
+    assert exc_info.value.code == 2
+    out, err = capsys.readouterr()
+    assert out == ""
+    assert err.startswith("usage:")
+    assert "invalid int value" in err
+    # The error was reported by a parser built with every group
+    assert parser._parser_groups == {
+        title for title, _, _ in parser._argument_groups()
+    }
+
+
+@pytest.mark.parametrize("no_help", (False, True))
+def test_error_on_tty(mockplan, capsys, monkeypatch, no_help):
+    parser = mockplan.parser
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+    if no_help:
+        monkeypatch.setenv("TESTPLAN_NO_HELP_ON_ERROR", "1")
+    else:
+        monkeypatch.delenv("TESTPLAN_NO_HELP_ON_ERROR", raising=False)
+
+    with argv_overridden("--timeout", "not-a-number"):
+        with pytest.raises(SystemExit) as exc_info:
+            parser.parse_args()
+
+    assert exc_info.value.code == 2
+    out, err = capsys.readouterr()
+    assert "invalid int value" in err
+    if no_help:
+        assert out == ""
+        assert err.startswith("usage:")
+    else:
+        assert out.startswith("usage:")
+        assert "--timeout" in out
+        assert not err.startswith("usage:")
+
+
+def test_error_help_lists_every_group(mockplan, capsys, monkeypatch):
+    parser = mockplan.parser
+    monkeypatch.delenv("TESTPLAN_NO_HELP_ON_ERROR", raising=False)
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+
+    with argv_overridden("--timeout", "not-a-number"):
+        with pytest.raises(SystemExit):
+            parser.parse_args()
+
+    out, _ = capsys.readouterr()
+    for title in ("General", "Filtering", "Ordering", "Reporting"):
+        assert title in out
+    assert "--pdf" in out
+
+
+@pytest.mark.parametrize(
+    "level_name, level", (("DEBUG", logger.DEBUG), ("NONE", None))
+)
+def test_file_log_level(mockplan, level_name, level):
+    parser = mockplan.parser
+
+    with argv_overridden("--file-log-level", level_name):
+        args = parser.parse_args()
+    assert args.file_log_level == level
+    assert LogLevelAction.LEVELS[level_name] == level
@@ -312,6 +312,15 @@ def test_assertion_skip(mockplan):
         assert len(condition_skip_case.entries) == 1
 
 
+def test_source_path_follows_cwd(tmp_path):
+    with path_utils.change_directory(str(tmp_path)):
+        resolved = result_mod._source_path("script.py")
+    assert resolved == str(tmp_path / "script.py")
+    assert result_mod._source_path("script.py") == os.path.abspath(
+        "script.py"
+    )
+
+
 @pytest.fixture
 def dict_ns():
     """Dict namespace with a mocked out result object."""